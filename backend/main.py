@@ -171,7 +171,7 @@ def watch_frontend_files():
             time.sleep(5)
 
 @app.on_event("startup")
-def on_startup():
+async def on_startup():
     global frontend_watcher_thread
 
     # Start frontend file watcher in background thread
@@ -413,16 +413,16 @@ def on_startup():
 
     # Initialize all services (scheduler, market data tasks, auto trading, etc.)
     print("About to initialize services...")
-    from services.startup import initialize_services
-    initialize_services()
+    from services.startup import startup_event
+    await startup_event()
     print("Services initialization completed")
 
 
 @app.on_event("shutdown")
-def on_shutdown():
+async def on_shutdown():
     # Shutdown all services (scheduler, market data tasks, auto trading, etc.)
-    from services.startup import shutdown_services
-    shutdown_services()
+    from services.startup import shutdown_event
+    await shutdown_event()
 
 
 # API routes
@@ -1695,8 +1695,7 @@ def save_ai_decision(
         )
 
         # Broadcast AI decision update via WebSocket
-        import asyncio
-        from api.ws import broadcast_model_chat_update
+        from api.ws import broadcast_model_chat_update, manager
 
         try:
             broadcast_data = {
@@ -1719,14 +1718,8 @@ def save_ai_decision(
                 "wallet_address": decision_log.wallet_address,
             }
             
-            # Check if there's a running event loop
-            try:
-                loop = asyncio.get_running_loop()
-                # Event loop is running, create task
-                loop.create_task(broadcast_model_chat_update(broadcast_data))
-            except RuntimeError:
-                # No running event loop, run synchronously
-                asyncio.run(broadcast_model_chat_update(broadcast_data))
+            # Run on the application event loop that owns the WebSocket connections
+            manager.schedule_task(broadcast_model_chat_update(broadcast_data))
         except Exception as broadcast_err:
             # Don't fail the save operation if broadcast fails
             logger.warning(f"Failed to broadcast AI decision update: {broadcast_err}")
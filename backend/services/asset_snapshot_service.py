@@ -15,6 +15,7 @@ from database.connection import SessionLocal
 from database.models import Account, AccountAssetSnapshot, Position
 from services.asset_curve_calculator import invalidate_asset_curve_cache
 from services.market_data import get_last_price
+from services.market_events import PriceTick
 from api.ws import broadcast_arena_asset_update, manager
 
 logger = logging.getLogger(__name__)
@@ -33,7 +34,7 @@ def _get_active_accounts(db: Session) -> List[Account]:
 # Global variable to track last snapshot time
 _last_snapshot_time = 0
 
-def handle_price_update(event: Dict[str, Any]) -> None:
+def handle_price_update(event: PriceTick) -> None:
     """Persist account asset snapshots based on the latest price event."""
     global _last_snapshot_time
 
@@ -51,9 +52,9 @@ def handle_price_update(event: Dict[str, Any]) -> None:
         if not accounts:
             return
 
-        trigger_symbol = event.get("symbol")
-        trigger_market = event.get("market", "CRYPTO")
-        event_time: datetime = event.get("event_time") or datetime.now(tz=timezone.utc)
+        trigger_symbol = event.symbol
+        trigger_market = event.market or "CRYPTO"
+        event_time: datetime = event.event_time or datetime.now(tz=timezone.utc)
 
         snapshots: List[AccountAssetSnapshot] = []
         symbol_totals = defaultdict(float)
@@ -3,6 +3,7 @@ Hyperliquid market data service using CCXT
 """
 import ccxt
 import logging
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone
 import time
@@ -69,13 +70,35 @@ class HyperliquidClient:
             ticker = self.exchange.fetch_ticker(formatted_symbol)
             price = ticker['last']
 
-            logger.info(f"Got price for {formatted_symbol}: {price}")
+            logger.info("Got price for %s: %s", formatted_symbol, price)
             return float(price) if price else None
 
         except Exception as e:
-            logger.error(f"Error fetching price for {symbol}: {e}")
+            logger.error("Error fetching price for %s: %s", symbol, e)
             return None
 
+    def get_all_mids(self) -> Dict[str, float]:
+        """Get mid prices for every listed coin in a single native API call"""
+        try:
+            import requests
+
+            if self.environment == "testnet":
+                api_url = "https://api.hyperliquid-testnet.xyz/info"
+            else:
+                api_url = "https://api.hyperliquid.xyz/info"
+
+            response = requests.post(api_url, json={"type": "allMids"}, timeout=10)
+            response.raise_for_status()
+            data = response.json()
+            if not isinstance(data, dict):
+                raise Exception("Invalid API response structure")
+
+            return {coin.upper(): float(px) for coin, px in data.items()}
+
+        except Exception as e:
+            logger.error("Error fetching Hyperliquid mid prices: %s", e)
+            return {}
+
     def get_ticker_data(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get complete ticker data using Hyperliquid native API"""
         try:
@@ -195,7 +218,7 @@ class HyperliquidClient:
 
             is_valid = price is not None and price > 0
             if is_valid:
-                logger.debug(f"Symbol {symbol} is tradable (price: {price})")
+                logger.debug("Symbol %s is tradable (price: %s)", symbol, price)
             return is_valid
 
         except Exception:
@@ -379,22 +402,30 @@ class HyperliquidClient:
 
     def _format_symbol(self, symbol: str) -> str:
         """Format symbol for CCXT (e.g., 'BTC' -> 'BTC/USDC:USDC')"""
-        if '/' in symbol and ':' in symbol:
-            return symbol
-        elif '/' in symbol:
-            # If it's BTC/USDC, convert to BTC/USDC:USDC for Hyperliquid
-            return f"{symbol}:USDC"
-        
-        # For single symbols like 'BTC', check if it's a mainstream crypto
-        symbol_upper = symbol.upper()
-        mainstream_cryptos = ['BTC', 'ETH', 'SOL', 'DOGE', 'BNB', 'XRP']
-        
-        if symbol_upper in mainstream_cryptos:
-            # Use perpetual swap format for mainstream cryptos
-            return f"{symbol_upper}/USDC:USDC"
-        else:
-            # Use spot format for other cryptos
-            return f"{symbol_upper}/USDC"
+        return _format_ccxt_symbol(symbol)
+
+
+_MAINSTREAM_CRYPTOS = frozenset({'BTC', 'ETH', 'SOL', 'DOGE', 'BNB', 'XRP'})
+
+
+@lru_cache(maxsize=1024)
+def _format_ccxt_symbol(symbol: str) -> str:
+    """Memoized symbol formatting - the symbol set is small and closed"""
+    if '/' in symbol and ':' in symbol:
+        return symbol
+    elif '/' in symbol:
+        # If it's BTC/USDC, convert to BTC/USDC:USDC for Hyperliquid
+        return f"{symbol}:USDC"
+
+    # For single symbols like 'BTC', check if it's a mainstream crypto
+    symbol_upper = symbol.upper()
+
+    if symbol_upper in _MAINSTREAM_CRYPTOS:
+        # Use perpetual swap format for mainstream cryptos
+        return f"{symbol_upper}/USDC:USDC"
+    else:
+        # Use spot format for other cryptos
+        return f"{symbol_upper}/USDC"
 
 
 # Client factory functions
@@ -141,7 +141,7 @@ def fetch_remote_symbols(environment: str = "testnet") -> List[Dict[str, str]]:
 
         # Validate symbol is actually tradable
         if not _validate_symbol_tradability(symbol, environment):
-            logger.debug(f"Skipping symbol {symbol} (not tradable on Hyperliquid)")
+            logger.debug("Skipping symbol %s (not tradable on Hyperliquid)", symbol)
             invalid_count += 1
             continue
 
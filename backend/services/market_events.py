@@ -2,47 +2,108 @@
 Market data event dispatcher for price updates.
 """
 
-from typing import Callable, List, Dict, Any
-from threading import Lock
+import logging
+import queue
+from datetime import datetime
+from typing import Callable, Any, NamedTuple, Tuple
+from threading import Lock, Thread
 
-PriceEventHandler = Callable[[Dict[str, Any]], None]
+logger = logging.getLogger(__name__)
+
+
+class PriceTick(NamedTuple):
+    """Price update event published by the market data stream."""
+
+    symbol: str
+    market: str
+    price: float
+    event_time: datetime
+    timestamp: float
+
+
+PriceEventHandler = Callable[[PriceTick], None]
+
+_STOP = object()
+
+
+class _HandlerWorker:
+    """Delivers events to a single handler from its own daemon thread.
+
+    The pending queue is bounded and drops the oldest event on overflow, so a
+    slow handler neither stalls the publisher nor grows memory without limit.
+    """
+
+    def __init__(self, handler: PriceEventHandler, max_pending: int) -> None:
+        self.handler = handler
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending)
+        name = getattr(handler, "__name__", "handler")
+        self._thread = Thread(target=self._run, name=f"market-event-{name}", daemon=True)
+        self._thread.start()
+
+    def put(self, event: Any) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full:
+                pass
+
+    def stop(self) -> None:
+        self.put(_STOP)
+
+    def _run(self) -> None:
+        while True:
+            event = self._queue.get()
+            if event is _STOP:
+                return
+            try:
+                self.handler(event)
+            except Exception:
+                # Handler errors should not block other subscribers
+                logger.exception("Market event handler failed")
 
 
 class MarketEventDispatcher:
-    """Simple thread-safe publish/subscribe dispatcher for market events."""
+    """Simple thread-safe publish/subscribe dispatcher for market events.
 
-    def __init__(self) -> None:
-        self._handlers: List[PriceEventHandler] = []
+    Each handler runs on its own worker thread, fed by a bounded queue.
+    Workers are stored as an immutable tuple that writers replace wholesale
+    (copy-on-write), so ``publish`` can read it without taking the lock.
+    """
+
+    def __init__(self, max_pending: int = 1000) -> None:
+        self._workers: Tuple[_HandlerWorker, ...] = ()
         self._lock = Lock()
+        self.max_pending = max_pending
 
     def subscribe(self, handler: PriceEventHandler) -> None:
         """Register a handler for price update events."""
         with self._lock:
-            if handler not in self._handlers:
-                self._handlers.append(handler)
+            if any(w.handler == handler for w in self._workers):
+                return
+            self._workers = self._workers + (_HandlerWorker(handler, self.max_pending),)
 
     def unsubscribe(self, handler: PriceEventHandler) -> None:
         """Remove a previously registered handler."""
         with self._lock:
-            if handler in self._handlers:
-                self._handlers.remove(handler)
+            removed = [w for w in self._workers if w.handler == handler]
+            if not removed:
+                return
+            self._workers = tuple(w for w in self._workers if w.handler != handler)
 
-    def publish(self, event: Dict[str, Any]) -> None:
-        """Broadcast an event to all handlers."""
-        # Copy to avoid race conditions if handlers mutate list
-        handlers_snapshot: List[PriceEventHandler]
-        with self._lock:
-            handlers_snapshot = list(self._handlers)
+        for worker in removed:
+            worker.stop()
 
-        for handler in handlers_snapshot:
-            try:
-                handler(event)
-            except Exception:
-                # Handler errors should not block other subscribers
-                import logging
-
-                logger = logging.getLogger(__name__)
-                logger.exception("Market event handler failed")
+    def publish(self, event: PriceTick) -> None:
+        """Broadcast an event to all handlers."""
+        # Attribute read is atomic; subscribers swap in a new tuple, never mutate it
+        for worker in self._workers:
+            worker.put(event)
 
 
 # Global dispatcher instance
@@ -57,5 +118,5 @@ def unsubscribe_price_updates(handler: PriceEventHandler) -> None:
     market_event_dispatcher.unsubscribe(handler)
 
 
-def publish_price_update(event: Dict[str, Any]) -> None:
+def publish_price_update(event: PriceTick) -> None:
     market_event_dispatcher.publish(event)
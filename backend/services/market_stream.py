@@ -7,6 +7,7 @@ from __future__ import annotations
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Iterable, List, Optional
 
@@ -14,11 +15,32 @@ from database.connection import SessionLocal
 from database.models import CryptoPriceTick
 from services.hyperliquid_market_data import get_default_hyperliquid_client
 from services.price_cache import record_price_update
-from services.market_events import publish_price_update
+from services.market_events import PriceTick, publish_price_update
 
 logger = logging.getLogger(__name__)
 
 
+class _RequestPacer:
+    """Thread-safe spacing of request start times across fetch workers.
+
+    CCXT's built-in rate limiter is not coordinated between threads, so
+    concurrent fallback fetches would otherwise burst the endpoint at once.
+    """
+
+    def __init__(self, min_interval: float) -> None:
+        self.min_interval = min_interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
 class MarketDataStream:
     """Background thread fetching market data at a steady cadence."""
 
@@ -28,11 +50,15 @@ class MarketDataStream:
         market: str = "CRYPTO",
         interval_seconds: float = 1.5,
         retention_seconds: int = 3600,
+        max_fetch_workers: int = 8,
+        min_request_interval: float = 0.05,
     ) -> None:
         self.symbols = list(symbols)
         self.market = market
         self.interval_seconds = interval_seconds
         self.retention_seconds = retention_seconds
+        self.max_fetch_workers = max_fetch_workers
+        self._pacer = _RequestPacer(min_request_interval)
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
 
@@ -61,24 +87,54 @@ class MarketDataStream:
         logger.info("Market data stream symbol set updated: %s", ", ".join(self.symbols))
 
     def _run(self) -> None:
-        while not self._stop_event.is_set():
-            start_time = time.time()
-            for symbol in self.symbols:
-                if self._stop_event.is_set():
-                    break
-                self._process_symbol(symbol)
-            elapsed = time.time() - start_time
-            sleep_for = max(0.0, self.interval_seconds - elapsed)
-            if sleep_for > 0:
-                time.sleep(sleep_for)
+        # One allMids request covers most symbols; the per-symbol fallback
+        # fetches are network-bound, so fan them out over a small pool.
+        with ThreadPoolExecutor(
+            max_workers=self.max_fetch_workers, thread_name_prefix="market-data-fetch"
+        ) as pool:
+            while not self._stop_event.is_set():
+                start_time = time.monotonic()
+                missing = self._process_batch(self.symbols)
+                if missing:
+                    list(pool.map(self._process_symbol, missing))
+                elapsed = time.monotonic() - start_time
+                sleep_for = max(0.0, self.interval_seconds - elapsed)
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+
+    def _process_batch(self, symbols: List[str]) -> List[str]:
+        """Publish prices from one allMids call; return symbols it did not cover."""
+        self._pacer.wait()
+        try:
+            mids = get_default_hyperliquid_client().get_all_mids()
+        except Exception as fetch_err:
+            logger.warning("Failed to fetch batch mid prices: %s", fetch_err)
+            return symbols
+
+        # One clock read for the whole batch - every price came from the same response
+        timestamp = time.time()
+        event_time = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+        missing: List[str] = []
+        for symbol in symbols:
+            price = mids.get(symbol.upper())
+            if price is None:
+                missing.append(symbol)
+            else:
+                self._publish_price(symbol, price, timestamp, event_time)
+        return missing
 
     def _process_symbol(self, symbol: str) -> None:
         """Fetch ticker for symbol, update cache, persist tick, publish event."""
+        if self._stop_event.is_set():
+            return
+
+        self._pacer.wait()
         try:
-            print(f"Fetching price for {symbol}...")
+            logger.debug("Fetching price for %s...", symbol)
             client = get_default_hyperliquid_client()
             ticker_price = client.get_last_price(symbol)
-            print(f"Got price for {symbol}: {ticker_price}")
+            logger.debug("Got price for %s: %s", symbol, ticker_price)
         except Exception as fetch_err:
             logger.warning("Failed to fetch price for %s: %s", symbol, fetch_err)
             return
@@ -87,27 +143,32 @@ class MarketDataStream:
             logger.debug("No price returned for %s", symbol)
             return
 
-        event_time = datetime.now(tz=timezone.utc)
-        timestamp = event_time.timestamp()
+        timestamp = time.time()
+        self._publish_price(
+            symbol, float(ticker_price), timestamp, datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        )
+
+    def _publish_price(self, symbol: str, price: float, timestamp: float, event_time: datetime) -> None:
+        """Update cache, persist tick and publish event for a fetched price."""
 
-        record_price_update(symbol, self.market, float(ticker_price), timestamp)
-        self._persist_tick(symbol, float(ticker_price), event_time)
+        record_price_update(symbol, self.market, price, timestamp)
+        self._persist_tick(symbol, price, event_time)
 
         publish_price_update(
-            {
-                "symbol": symbol,
-                "market": self.market,
-                "price": float(ticker_price),
-                "event_time": event_time,
-                "timestamp": timestamp,
-            }
+            PriceTick(
+                symbol=symbol,
+                market=self.market,
+                price=price,
+                event_time=event_time,
+                timestamp=timestamp,
+            )
         )
 
     def _persist_tick(self, symbol: str, price: float, event_time: datetime) -> None:
         """Persist tick data and prune old entries beyond retention window."""
         # DISABLED: Price data not used anywhere, only causes DB locks
         # All trading uses real-time API prices instead
-        logger.debug(f"Price tick for {symbol}: {price} (DB write disabled)")
+        logger.debug("Price tick for %s: %s (DB write disabled)", symbol, price)
         return
 
 
@@ -349,30 +349,29 @@ def reset_auto_trading_job():
 
 def start_asset_curve_broadcast():
     """Start asset curve broadcast task - broadcasts every 60 seconds"""
-    import asyncio
-    from api.ws import broadcast_asset_curve_update
+    from api.ws import get_all_asset_curves_data, manager
 
     def broadcast_all_timeframes():
         """Broadcast asset curve updates for all timeframes"""
         try:
-            # Create event loop for async tasks
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            if not manager.has_connections():
+                return
 
-            # Broadcast updates for all timeframes
-            loop.run_until_complete(broadcast_asset_curve_update("5m"))
-            loop.run_until_complete(broadcast_asset_curve_update("1h"))
-            loop.run_until_complete(broadcast_asset_curve_update("1d"))
+            # Aggregate on this scheduler thread; only the sends run on the
+            # application event loop that owns the WebSocket connections
+            with SessionLocal() as db:
+                for timeframe in ("5m", "1h", "1d"):
+                    asset_curves = get_all_asset_curves_data(db, timeframe)
+                    manager.schedule_task(manager.broadcast_to_all({
+                        "type": "asset_curve_update",
+                        "timeframe": timeframe,
+                        "data": asset_curves
+                    }))
 
-            logger.debug("Broadcasted asset curve updates for all timeframes")
+            logger.debug("Scheduled asset curve updates for all timeframes")
 
         except Exception as e:
             logger.error(f"Failed to broadcast asset curve updates: {e}")
-        finally:
-            try:
-                loop.close()
-            except:
-                pass
 
     try:
         # Ensure scheduler is running
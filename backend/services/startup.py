@@ -1,5 +1,6 @@
 """Application startup initialization service"""
 
+import asyncio
 import logging
 import threading
 
@@ -9,39 +10,128 @@ from services.auto_trader import (
     AUTO_TRADE_JOB_ID,
     AI_TRADE_JOB_ID
 )
-from services.scheduler import start_scheduler, setup_market_tasks, task_scheduler
+from services.scheduler import (
+    start_scheduler,
+    stop_scheduler,
+    setup_market_tasks,
+    start_asset_curve_broadcast,
+    task_scheduler,
+)
+from services.price_cache import clear_expired_prices
+from services import market_stream
 from services.market_stream import start_market_stream, stop_market_stream
 from services.market_events import subscribe_price_updates, unsubscribe_price_updates
 from services.asset_snapshot_service import handle_price_update
-from services.trading_strategy import start_strategy_manager, stop_strategy_manager
+from services.trading_strategy import (
+    start_strategy_manager,
+    stop_strategy_manager,
+    handle_price_update as strategy_price_update,
+)
+from services.hyperliquid_snapshot_service import hyperliquid_snapshot_service
+from services.kline_realtime_collector import realtime_collector
 from services.hyperliquid_symbol_service import (
     refresh_hyperliquid_symbols,
     schedule_symbol_refresh_task,
     build_market_stream_symbols,
+    refresh_market_stream_symbols,
 )
 
 logger = logging.getLogger(__name__)
 
+STARTUP_TIMEOUT_SECONDS = 120
+# How long startup waits for the symbol catalog refresh before using the stored catalog
+SYMBOL_REFRESH_WAIT_SECONDS = 60
+SHUTDOWN_TIMEOUT_SECONDS = 30
+
+# Guards against concurrent/double startup (e.g. reloads or repeated hooks)
+_services_init_lock = asyncio.Lock()
+_services_initialized = False
+# Keeps the catalog refresh referenced if startup stops waiting for it
+_symbol_refresh_task = None
+
+
+async def initialize_services():
+    """Initialize all services once; concurrent callers wait and return."""
+    global _services_initialized
+    async with _services_init_lock:
+        if _services_initialized:
+            logger.info("Services already initialized, skipping")
+            return
+        await _start_services()
+        _services_initialized = True
+
 
-def initialize_services():
-    """Initialize all services"""
+def strategy_price_wrapper(event, _update=strategy_price_update):
+    """Wrapper to convert event format for strategy manager
+
+    Module-level so re-initialization subscribes the same handler and
+    shutdown can unsubscribe it.
+    """
+    # Called per price tick; _update is bound as a local to skip the global lookup
+    if event.symbol and event.price:
+        _update(event.symbol, event.price, event.event_time)
+
+
+def _refresh_symbols_safely():
+    """Refresh the symbol catalog; failures leave the stored catalog in place"""
+    try:
+        refresh_hyperliquid_symbols()
+    except Exception:
+        logger.exception("Hyperliquid symbol catalog refresh failed, using stored catalog")
+
+
+def _apply_late_symbol_refresh(task):
+    """Push a catalog refresh that outlived startup into the running market stream"""
+    global _symbol_refresh_task
+    # Before the stream starts, startup builds its symbols from the refreshed catalog
+    if task.cancelled() or market_stream.market_data_stream is None:
+        return
+
+    def _update_stream_symbols():
+        try:
+            refresh_market_stream_symbols()
+        except Exception:
+            logger.exception("Failed to apply refreshed symbols to market stream")
+
+    # Done callbacks run on the event loop; keep the DB work off it
+    _symbol_refresh_task = asyncio.get_running_loop().create_task(
+        asyncio.to_thread(_update_stream_symbols)
+    )
+
+
+async def _wait_for_symbol_refresh(task):
+    """Wait a bounded time for the catalog refresh without ever cancelling it"""
+    try:
+        await asyncio.wait_for(asyncio.shield(task), SYMBOL_REFRESH_WAIT_SECONDS)
+    except TimeoutError:
+        logger.warning(
+            "Symbol catalog refresh still running after %ss, starting with stored catalog",
+            SYMBOL_REFRESH_WAIT_SECONDS,
+        )
+        # The refresh may still rewrite the watchlist; apply it when it lands
+        task.add_done_callback(_apply_late_symbol_refresh)
+
+
+async def _start_services():
+    """Start all services
+
+    Independent blocking steps (symbol catalog refresh, strategy loading) run
+    concurrently in worker threads so they don't serialize application startup.
+    The catalog refresh validates every symbol over HTTP and can be slow, so
+    startup waits for it only up to SYMBOL_REFRESH_WAIT_SECONDS and the
+    refresh itself is shielded from the startup timeout.
+    """
+    global _symbol_refresh_task
     try:
         # Start the scheduler
-        print("Starting scheduler...")
         start_scheduler()
-        print("Scheduler started")
         logger.info("Scheduler service started")
 
-        # Refresh Hyperliquid symbol catalog + schedule periodic updates
-        refresh_hyperliquid_symbols()
-        schedule_symbol_refresh_task()
-
         # Set up market-related scheduled tasks
         setup_market_tasks()
         logger.info("Market scheduled tasks have been set up")
 
         # Add price cache cleanup task (every 2 minutes)
-        from services.price_cache import clear_expired_prices
         task_scheduler.add_interval_task(
             task_func=clear_expired_prices,
             interval_seconds=120,  # Clean every 2 minutes
@@ -49,89 +139,88 @@ def initialize_services():
         )
         logger.info("Price cache cleanup task started (2-minute interval)")
 
-        # Start market data stream
+        # Refresh Hyperliquid symbol catalog and load AI trading strategies in parallel
+        _symbol_refresh_task = asyncio.create_task(asyncio.to_thread(_refresh_symbols_safely))
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(asyncio.to_thread(start_strategy_manager))
+            tg.create_task(_wait_for_symbol_refresh(_symbol_refresh_task))
+        schedule_symbol_refresh_task()
+
+        # Start market data stream (symbols depend on the refreshed catalog)
         # NOTE: Paper trading snapshot service disabled - using Hyperliquid snapshots only
-        combined_symbols = build_market_stream_symbols()
-        print("Starting market data stream...")
+        combined_symbols = await asyncio.to_thread(build_market_stream_symbols)
         start_market_stream(combined_symbols, interval_seconds=1.5)
-        print("Market data stream started")
         # subscribe_price_updates(handle_price_update)  # DISABLED: Paper trading snapshot
         # print("Asset snapshot handler subscribed")
         logger.info("Market data stream initialized")
 
         # Subscribe strategy manager to price updates
-        from services.trading_strategy import handle_price_update as strategy_price_update
-
-        def strategy_price_wrapper(event):
-            """Wrapper to convert event format for strategy manager"""
-            symbol = event.get("symbol")
-            price = event.get("price")
-            event_time = event.get("event_time")
-            if symbol and price:
-                strategy_price_update(symbol, float(price), event_time)
-
         subscribe_price_updates(strategy_price_wrapper)
         logger.info("Strategy manager subscribed to price updates")
 
-        # Start AI trading strategy manager
-        print("Starting strategy manager...")
-        start_strategy_manager()
-        print("Strategy manager started")
-
         # Start asset curve broadcast task (every 60 seconds)
-        from services.scheduler import start_asset_curve_broadcast
         start_asset_curve_broadcast()
         logger.info("Asset curve broadcast task started (60-second interval)")
 
         # Start Hyperliquid account snapshot service (every 30 seconds)
-        from services.hyperliquid_snapshot_service import hyperliquid_snapshot_service
-        import asyncio
         asyncio.create_task(hyperliquid_snapshot_service.start())
         logger.info("Hyperliquid snapshot service started (30-second interval)")
 
         # Start K-line realtime collection service
-        from services.kline_realtime_collector import realtime_collector
         asyncio.create_task(realtime_collector.start())
         logger.info("K-line realtime collection service started (1-minute interval)")
 
         logger.info("All services initialized successfully")
 
-    except Exception as e:
-        logger.error(f"Service initialization failed: {e}")
+    except Exception:
+        logger.exception("Service initialization failed")
         raise
 
 
-def shutdown_services():
+async def shutdown_services():
     """Shut down all services"""
+    global _services_initialized
     try:
-        from services.scheduler import stop_scheduler
-        from services.hyperliquid_snapshot_service import hyperliquid_snapshot_service
-        from services.kline_realtime_collector import realtime_collector
-        import asyncio
-
-        stop_strategy_manager()
-        stop_market_stream()
+        # A late catalog refresh must not restart the market stream after this
+        if _symbol_refresh_task is not None:
+            _symbol_refresh_task.remove_done_callback(_apply_late_symbol_refresh)
+
+        # Both stops join worker threads; run them off the event loop so the
+        # shutdown timeout can still fire
+        await asyncio.gather(
+            asyncio.to_thread(stop_strategy_manager),
+            asyncio.to_thread(stop_market_stream),
+        )
+        unsubscribe_price_updates(strategy_price_wrapper)
         unsubscribe_price_updates(handle_price_update)
         hyperliquid_snapshot_service.stop()
 
-        # Stop K-line realtime collector
-        asyncio.create_task(realtime_collector.stop())
+        # Stop K-line realtime collector; its tasks live on this event loop,
+        # so await it directly to let them finish cancelling before exit
+        await realtime_collector.stop()
 
-        stop_scheduler()
         logger.info("All services have been shut down")
 
     except Exception as e:
         logger.error(f"Failed to shut down services: {e}")
+    finally:
+        # Runs even if the shutdown timeout cancels one of the awaits above
+        stop_scheduler()
+        _services_initialized = False
 
 
 async def startup_event():
     """FastAPI application startup event"""
-    initialize_services()
+    # Fail startup instead of hanging forever on a stalled network/DB step;
+    # the catalog refresh is shielded and bounded separately
+    async with asyncio.timeout(STARTUP_TIMEOUT_SECONDS):
+        await initialize_services()
 
 
 async def shutdown_event():
     """FastAPI application shutdown event"""
-    await shutdown_services()
+    async with asyncio.timeout(SHUTDOWN_TIMEOUT_SECONDS):
+        await shutdown_services()
 
 
 def schedule_auto_trading(interval_seconds: int = 300, max_ratio: float = 0.2, use_ai: bool = True) -> None:
@@ -142,13 +231,6 @@ def schedule_auto_trading(interval_seconds: int = 300, max_ratio: float = 0.2, u
         max_ratio: Maximum portion of portfolio to use per trade
         use_ai: If True, use AI-driven trading; if False, use random trading
     """
-    from services.auto_trader import (
-        place_ai_driven_crypto_order,
-        place_random_crypto_order,
-        AUTO_TRADE_JOB_ID,
-        AI_TRADE_JOB_ID
-    )
-
     def execute_trade():
         try:
             if use_ai:
@@ -6,14 +6,14 @@ from __future__ import annotations
 
 import logging
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Tuple
 
 from database.connection import SessionLocal
 from database.models import Account, AccountStrategyConfig, GlobalSamplingConfig
-from sqlalchemy import text
+from sqlalchemy import bindparam, select, text
 from repositories.strategy_repo import (
     get_strategy_by_account,
     list_strategies,
@@ -29,19 +29,44 @@ from services.hyperliquid_symbol_service import get_selected_symbols as get_hype
 logger = logging.getLogger(__name__)
 
 STRATEGY_REFRESH_INTERVAL = 60.0  # seconds
+STRATEGY_MAX_REFRESH_INTERVAL = 300.0  # seconds, backoff cap while config is idle
+STRATEGY_REFRESH_BACKOFF = 1.5
+DEFAULT_SAMPLING_INTERVAL = 18  # seconds
+STRATEGY_EXECUTOR_WORKERS = 8
+PRICE_COALESCE_WINDOW = 0.1  # seconds; repeat ticks for a symbol inside this are dropped
+
+# Built once so refreshes and executions reuse the engine's compiled-statement cache
+_STRATEGY_LOAD_STMT = select(AccountStrategyConfig, Account).join(
+    Account, AccountStrategyConfig.account_id == Account.id
+)
+# Row-locks only the config row; a row already locked by another execution is skipped
+_STRATEGY_BY_ACCOUNT_STMT = (
+    _STRATEGY_LOAD_STMT
+    .where(AccountStrategyConfig.account_id == bindparam("account_id"))
+    .with_for_update(skip_locked=True, of=AccountStrategyConfig)
+)
 
 
 def _as_aware(dt: Optional[datetime]) -> Optional[datetime]:
     """Ensure stored timestamps are timezone-aware UTC."""
-    if dt is None:
-        return None
+    if dt is None or dt.tzinfo is timezone.utc:
+        return dt
     if dt.tzinfo is None:
-        local_tz = datetime.now().astimezone().tzinfo
-        return dt.replace(tzinfo=local_tz).astimezone(timezone.utc)
+        # Stored timestamps are naive UTC (see _to_naive_utc)
+        return dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
 
-@dataclass
+def _to_naive_utc(dt: datetime) -> datetime:
+    """Convert to the naive UTC form stored in TIMESTAMP columns."""
+    if dt.tzinfo is None:
+        return dt
+    if dt.tzinfo is timezone.utc:
+        return dt.replace(tzinfo=None)
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass(slots=True)
 class StrategyState:
     account_id: int
     price_threshold: float  # Price change threshold (%)
@@ -49,10 +74,40 @@ class StrategyState:
     enabled: bool
     last_trigger_at: Optional[datetime]
     running: bool = False
-    lock: threading.Lock = field(default_factory=threading.Lock)
-
-    def should_trigger(self, symbol: str, event_time: datetime) -> bool:
-        """Check if strategy should trigger based on price threshold or time interval"""
+    # POSIX mirror of last_trigger_at, kept in sync so ticks compare floats only
+    last_trigger_ts: float = 0.0
+    # Guards only the running False -> True transition (see _claim_run)
+    _claim_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.last_trigger_at is not None and not self.last_trigger_ts:
+            self.last_trigger_ts = self.last_trigger_at.timestamp()
+
+    def set_last_trigger(self, when: datetime, ts: Optional[float] = None) -> None:
+        """Update last_trigger_at and its float mirror together"""
+        self.last_trigger_at = when
+        self.last_trigger_ts = when.timestamp() if ts is None else ts
+
+    def _claim_run(self) -> bool:
+        """Atomically set running; return False if another trigger already holds it"""
+        with self._claim_lock:
+            if self.running:
+                return False
+            self.running = True
+            return True
+
+    def should_trigger(
+        self,
+        symbol: str,
+        event_time: datetime,
+        now_ts: float,
+        price_change: Optional[float],
+    ) -> bool:
+        """Check if strategy should trigger based on price threshold or time interval
+
+        ``now_ts`` and ``price_change`` are computed once per tick by the caller
+        and shared across all accounts.
+        """
         if not self.enabled:
             return False
 
@@ -60,51 +115,68 @@ class StrategyState:
         if self.running:
             return False
 
-        with self.lock:
-            # Double-check after acquiring lock
-            if self.running:
-                return False
+        # Evaluate both triggers lock-free; most ticks fire neither
+        price_trigger = (price_change is not None and
+                        abs(price_change) >= self.price_threshold)
+        last_ts = self.last_trigger_ts
+        time_diff = now_ts - last_ts
+        time_trigger = time_diff >= self.trigger_interval
+        if not (time_trigger or price_trigger):
+            return False
 
-            now_ts = event_time.timestamp()
-            last_ts = self.last_trigger_at.timestamp() if self.last_trigger_at else 0
-            time_diff = now_ts - last_ts
+        if not self._claim_run():
+            return False
 
-            # Check time interval trigger
-            time_trigger = time_diff >= self.trigger_interval
+        # A run may have completed between the snapshot and the claim
+        if self.last_trigger_ts != last_ts and not price_trigger:
+            time_diff = now_ts - self.last_trigger_ts
+            if time_diff < self.trigger_interval:
+                self.running = False
+                return False
 
-            # Check price threshold trigger
-            price_change = sampling_pool.get_price_change_percent(symbol)
-            price_trigger = (price_change is not None and
-                            abs(price_change) >= self.price_threshold)
-
-            if time_trigger or price_trigger:
-                # Immediately update timestamp and set running state
-                # This prevents duplicate triggers while AI is executing
-                self.last_trigger_at = event_time
-                self.running = True
-
-                # Build trigger reason for logging
-                trigger_reasons = []
-                if time_trigger:
-                    trigger_reasons.append(f"Time interval ({time_diff:.1f}s / {self.trigger_interval}s)")
-                if price_trigger:
-                    trigger_reasons.append(f"Price change ({price_change:.2f}% / {self.price_threshold}%)")
+        # Immediately update timestamp (running already set by the claim)
+        # This prevents duplicate triggers while AI is executing
+        self.set_last_trigger(event_time, now_ts)
 
-                logger.info(
-                    f"Strategy triggered for account {self.account_id} on {symbol}: "
-                    f"{', '.join(trigger_reasons)}"
-                )
-                return True
+        # Build trigger reason for logging
+        trigger_reasons = []
+        if time_trigger:
+            trigger_reasons.append(f"Time interval ({time_diff:.1f}s / {self.trigger_interval}s)")
+        if price_trigger:
+            trigger_reasons.append(f"Price change ({price_change:.2f}% / {self.price_threshold}%)")
 
-            return False
+        logger.info(
+            f"Strategy triggered for account {self.account_id} on {symbol}: "
+            f"{', '.join(trigger_reasons)}"
+        )
+        return True
 
 
 class StrategyManager:
+    # Prepended to log lines so subclasses can be told apart
+    _log_prefix = ""
+
     def __init__(self):
         self.strategies: Dict[int, StrategyState] = {}
+        # Immutable view of strategies for the tick path, rebuilt on every load
+        self._strategies_snapshot: Tuple[Tuple[int, StrategyState], ...] = ()
+        # False when no loaded strategy is enabled, so ticks can skip trigger checks
+        self._any_armed: bool = False
         self.lock = threading.Lock()
         self.running = False
         self.refresh_thread: Optional[threading.Thread] = None
+        # Set by stop() to wake the refresh thread out of its wait immediately
+        self._stop_event = threading.Event()
+        # Refreshed together with strategies so price ticks never hit the database
+        self._sampling_interval: int = DEFAULT_SAMPLING_INTERVAL
+        # Strategy executions (AI call + order) run here, off the price-update thread
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Result of _config_version() at the last successful load
+        self._last_seen_version: Optional[tuple] = None
+        self._refresh_interval: float = STRATEGY_REFRESH_INTERVAL
+        # Event timestamp of the last tick handled per symbol (single-key dict ops are atomic)
+        self._last_handled: Dict[str, float] = {}
+        self._coalesce_window: float = PRICE_COALESCE_WINDOW
 
     def start(self):
         """Start the strategy manager"""
@@ -114,6 +186,12 @@ class StrategyManager:
                 return
 
             self.running = True
+            self._stop_event.clear()
+            self._refresh_interval = STRATEGY_REFRESH_INTERVAL
+            self._executor = ThreadPoolExecutor(
+                max_workers=STRATEGY_EXECUTOR_WORKERS,
+                thread_name_prefix="strategy-exec",
+            )
             self._load_strategies()
 
             # Start refresh thread
@@ -132,10 +210,16 @@ class StrategyManager:
                 return
 
             self.running = False
+            self._stop_event.set()
+            executor, self._executor = self._executor, None
 
         if self.refresh_thread:
             self.refresh_thread.join(timeout=5.0)
 
+        # Don't wait for in-flight AI executions (they may take 10-30 seconds)
+        if executor:
+            executor.shutdown(wait=False)
+
         logger.info("Strategy manager stopped")
 
     def _load_strategies(self):
@@ -144,71 +228,163 @@ class StrategyManager:
             # PostgreSQL handles concurrent access natively
             db = SessionLocal()
             try:
-                rows = (
-                    db.query(AccountStrategyConfig, Account)
-                    .join(Account, AccountStrategyConfig.account_id == Account.id)
-                    .all()
-                )
+                # Read the version first so changes made during the load are not missed
+                version = self._config_version(db)
+                rows = self._load_rows(db)
+                self._load_sampling_interval(db)
 
-                self.strategies.clear()
+                debug = logger.isEnabledFor(logging.DEBUG)
+                strategies: Dict[int, StrategyState] = {}
                 for strategy, account in rows:
-                    state = StrategyState(
-                        account_id=strategy.account_id,
-                        price_threshold=strategy.price_threshold,
-                        trigger_interval=strategy.trigger_interval,
-                        enabled=strategy.enabled == "true",
-                        last_trigger_at=_as_aware(strategy.last_trigger_at),
-                    )
-                    self.strategies[strategy.account_id] = state
-
-                    # DEBUG: Print loaded strategy configuration
-                    print(
-                        f"[DEBUG] Loaded strategy for account {strategy.account_id} ({account.name}): "
-                        f"interval={strategy.trigger_interval}s ({strategy.trigger_interval/60:.1f}min), "
-                        f"threshold={strategy.price_threshold}%, enabled={strategy.enabled}, "
-                        f"last_trigger={state.last_trigger_at}"
-                    )
-
-                logger.info(f"Loaded {len(self.strategies)} strategies")
+                    state = self._merge_state(strategy)
+                    strategies[strategy.account_id] = state
+
+                    if debug:
+                        logger.debug(
+                            "%sLoaded strategy for account %s (%s): interval=%ss (%.1fmin), "
+                            "threshold=%s%%, enabled=%s, last_trigger=%s",
+                            self._log_prefix, strategy.account_id, account.name,
+                            strategy.trigger_interval, strategy.trigger_interval / 60,
+                            strategy.price_threshold, strategy.enabled, state.last_trigger_at,
+                        )
+
+                self.strategies = strategies
+                self._strategies_snapshot = tuple(strategies.items())
+                self._any_armed = any(state.enabled for state in strategies.values())
+                self._last_seen_version = version
+                logger.info(f"{self._log_prefix}Loaded {len(self.strategies)} strategies")
             finally:
                 db.close()
 
         except Exception as e:
-            logger.error(f"Failed to load strategies: {e}")
+            logger.error(f"{self._log_prefix}Failed to load strategies: {e}")
             # Don't retry immediately on database lock
             if "database is locked" in str(e):
-                logger.warning("Database locked, skipping strategy refresh")
+                logger.warning(f"{self._log_prefix}Database locked, skipping strategy refresh")
+
+    def _load_rows(self, db):
+        """Return the (AccountStrategyConfig, Account) rows this manager drives"""
+        return db.execute(_STRATEGY_LOAD_STMT).all()
+
+    def _merge_state(self, strategy: AccountStrategyConfig) -> StrategyState:
+        """Build or update the in-memory state for a strategy row
+
+        Existing states are updated in place so a refresh doesn't reset the
+        running flag of an execution that is still in flight.
+        """
+        last_trigger_at = _as_aware(strategy.last_trigger_at)
+        state = self.strategies.get(strategy.account_id)
+        if state is None:
+            return StrategyState(
+                account_id=strategy.account_id,
+                price_threshold=strategy.price_threshold,
+                trigger_interval=strategy.trigger_interval,
+                enabled=strategy.enabled == "true",
+                last_trigger_at=last_trigger_at,
+            )
+
+        state.price_threshold = strategy.price_threshold
+        state.trigger_interval = strategy.trigger_interval
+        state.enabled = strategy.enabled == "true"
+        # The in-memory timestamp is set at trigger time, before it is persisted
+        if last_trigger_at and (state.last_trigger_at is None or last_trigger_at > state.last_trigger_at):
+            state.set_last_trigger(last_trigger_at)
+        return state
+
+    @staticmethod
+    def _config_version(db):
+        """Cheap probe that changes whenever strategy or sampling config changes
+
+        Built from the config columns only: account_strategy_configs.updated_at
+        is bumped by every last_trigger_at write, so it would force a reload
+        after each trigger.
+        """
+        strategy_rows = db.execute(text(
+            "SELECT account_id, enabled, price_threshold, trigger_interval "
+            "FROM account_strategy_configs ORDER BY account_id"
+        )).all()
+        sampling_updated_at = db.execute(text(
+            "SELECT MAX(updated_at) FROM global_sampling_configs"
+        )).scalar()
+        return tuple(tuple(row) for row in strategy_rows), sampling_updated_at
+
+    def _config_changed(self) -> bool:
+        """Return True if the stored configuration differs from the last load"""
+        with SessionLocal() as db:
+            return self._config_version(db) != self._last_seen_version
+
+    def _load_sampling_interval(self, db):
+        """Cache the global sampling interval from the open session"""
+        global_config = db.query(GlobalSamplingConfig).first()
+        self._sampling_interval = (
+            global_config.sampling_interval if global_config else DEFAULT_SAMPLING_INTERVAL
+        )
 
     def _refresh_strategies_loop(self):
-        """Periodically refresh strategies from database"""
-        while self.running:
+        """Periodically refresh strategies from database
+
+        The interval backs off while the configuration is unchanged and snaps
+        back to STRATEGY_REFRESH_INTERVAL as soon as a change is seen. Trigger
+        bookkeeping is not part of _config_version(), so live trading does not
+        reset the backoff.
+        """
+        while not self._stop_event.is_set():
             try:
-                time.sleep(STRATEGY_REFRESH_INTERVAL)
-                if self.running:
+                if self._stop_event.wait(self._refresh_interval):
+                    break
+                if self._config_changed():
                     self._load_strategies()
+                    self._refresh_interval = STRATEGY_REFRESH_INTERVAL
+                else:
+                    self._refresh_interval = min(
+                        self._refresh_interval * STRATEGY_REFRESH_BACKOFF,
+                        STRATEGY_MAX_REFRESH_INTERVAL,
+                    )
             except Exception as e:
                 logger.error(f"Error in strategy refresh loop: {e}")
 
     def handle_price_update(self, symbol: str, price: float, event_time: datetime):
         """Handle price update and check for strategy triggers"""
         try:
+            # Coalesce bursts: a repeat tick this close adds nothing at trigger granularity
+            now_ts = event_time.timestamp()
+            # A negative gap means the wall clock stepped back; handle the tick
+            if 0.0 <= now_ts - self._last_handled.get(symbol, 0.0) < self._coalesce_window:
+                return
+            self._last_handled[symbol] = now_ts
+
             # Add to sampling pool if needed
-            with SessionLocal() as db:
-                global_config = db.query(GlobalSamplingConfig).first()
-                sampling_interval = global_config.sampling_interval if global_config else 18
+            if sampling_pool.should_sample(symbol, self._sampling_interval):
+                sampling_pool.add_sample(symbol, price, now_ts)
 
-            if sampling_pool.should_sample(symbol, sampling_interval):
-                sampling_pool.add_sample(symbol, price, event_time.timestamp())
+            # Samples also feed AI prompts, so only the trigger checks are skipped
+            if not self._any_armed:
+                return
+
+            # Per-symbol work is shared by every account, so compute it once per tick
+            price_change = sampling_pool.get_price_change_percent(symbol)
 
             # Check each strategy for triggers
-            for account_id, state in self.strategies.items():
-                if state.should_trigger(symbol, event_time):
-                    self._execute_strategy(account_id, symbol, event_time)
+            for account_id, state in self._strategies_snapshot:
+                if state.should_trigger(symbol, event_time, now_ts, price_change):
+                    self._submit_strategy(state, account_id, symbol, event_time)
 
         except Exception as e:
             logger.error(f"Error handling price update for {symbol}: {e}")
             print(f"Error in strategy manager: {e}")
 
+    def _submit_strategy(self, state: StrategyState, account_id: int, symbol: str, event_time: datetime):
+        """Run a triggered strategy on the executor so the price feed is never blocked"""
+        executor = self._executor
+        try:
+            if executor is None:
+                raise RuntimeError("strategy executor not running")
+            executor.submit(self._execute_strategy, account_id, symbol, event_time)
+        except RuntimeError as e:
+            # Manager stopped between trigger and submit; release the claimed run
+            state.running = False
+            logger.warning(f"Skipping strategy execution for account {account_id}: {e}")
+
     def _execute_strategy(self, account_id: int, symbol: str, event_time: datetime):
         """Execute strategy for account"""
         state = self.strategies.get(account_id)
@@ -217,36 +393,46 @@ class StrategyManager:
 
         # Note: running state and timestamp already set in should_trigger
         try:
-            # Immediately persist timestamp to database (before AI call)
+            # shutdown(wait=False) still runs queued work; never place orders after stop()
+            if self._stop_event.is_set():
+                logger.info(f"{self._log_prefix}Manager stopped, dropping queued execution for account {account_id}")
+                return
+
+            # Check account configuration and persist timestamp (before AI call) in one session
             with SessionLocal() as db:
-                from database.models import AccountStrategyConfig
-                strategy = db.query(AccountStrategyConfig).filter_by(account_id=account_id).first()
-                if strategy:
-                    strategy.last_trigger_at = event_time
-                    db.commit()
+                row = db.execute(_STRATEGY_BY_ACCOUNT_STMT, {"account_id": account_id}).first()
+                if row is None:
                     logger.info(
-                        f"Strategy execution started for account {account_id}, "
-                        f"next trigger in {strategy.trigger_interval}s ({strategy.trigger_interval/60:.1f}min)"
+                        f"{self._log_prefix}Strategy row for account {account_id} missing or locked "
+                        "by a concurrent execution, skipping"
                     )
-
-            # Check account configuration
-            with SessionLocal() as db:
-                account = db.query(Account).filter(Account.id == account_id).first()
-                if not account or account.auto_trading_enabled != "true":
-                    logger.debug(f"Account {account_id} auto trading disabled, skipping strategy execution")
                     return
+                if row[1].auto_trading_enabled != "true":
+                    logger.debug(f"{self._log_prefix}Account {account_id} auto trading disabled, skipping strategy execution")
+                    return
+
+                strategy = row[0]
+                strategy.last_trigger_at = _to_naive_utc(event_time)
+                db.commit()
+                logger.info(
+                    f"{self._log_prefix}Strategy execution started for account {account_id}, "
+                    f"next trigger in {strategy.trigger_interval}s ({strategy.trigger_interval/60:.1f}min)"
+                )
 
             # Execute AI trading decision (may take 10-30 seconds, but won't block next trigger check)
-            logger.info(f"Account {account_id} executing Hyperliquid trading")
-            from services.trading_commands import place_ai_driven_hyperliquid_order
-            place_ai_driven_hyperliquid_order(account_id=account_id)
+            logger.info(f"{self._log_prefix}Account {account_id} executing Hyperliquid trading")
+            self._place_order(account_id)
 
         except Exception as e:
-            logger.error(f"Error executing strategy for account {account_id}: {e}")
+            logger.error(f"{self._log_prefix}Error executing strategy for account {account_id}: {e}")
         finally:
             # Always reset running state
             state.running = False
 
+    def _place_order(self, account_id: int):
+        """Place the AI-driven order for a triggered account"""
+        place_ai_driven_hyperliquid_order(account_id=account_id)
+
     def get_strategy_status(self) -> Dict[str, Any]:
         """Get status of all strategies"""
         status = {
@@ -269,79 +455,9 @@ class StrategyManager:
 
 # Hyperliquid-only strategy manager
 class HyperliquidStrategyManager(StrategyManager):
-    def _load_strategies(self):
-        """Load only Hyperliquid-enabled strategies from database"""
-        try:
-            db = SessionLocal()
-            try:
-                rows = (
-                    db.query(AccountStrategyConfig, Account)
-                    .join(Account, AccountStrategyConfig.account_id == Account.id)
-                    .all()
-                )
-
-                self.strategies.clear()
-                for strategy, account in rows:
-                    state = StrategyState(
-                        account_id=strategy.account_id,
-                        price_threshold=strategy.price_threshold,
-                        trigger_interval=strategy.trigger_interval,
-                        enabled=strategy.enabled == "true",
-                        last_trigger_at=_as_aware(strategy.last_trigger_at),
-                    )
-                    self.strategies[strategy.account_id] = state
-
-                # DEBUG: Print loaded strategy configuration
-                    print(
-                        f"[HyperliquidStrategy DEBUG] Loaded strategy for account {strategy.account_id} ({account.name}): "
-                        f"interval={strategy.trigger_interval}s ({strategy.trigger_interval/60:.1f}min), "
-                        f"threshold={strategy.price_threshold}%, enabled={strategy.enabled}, "
-                        f"last_trigger={state.last_trigger_at}"
-                    )
-
-                logger.info(f"[HyperliquidStrategy] Loaded {len(self.strategies)} strategies")
-            finally:
-                db.close()
-
-        except Exception as e:
-            logger.error(f"[HyperliquidStrategy] Failed to load strategies: {e}")
-            if "database is locked" in str(e):
-                logger.warning("[HyperliquidStrategy] Database locked, skipping strategy refresh")
-
-    def _execute_strategy(self, account_id: int, symbol: str, event_time: datetime):
-        """Execute strategy for Hyperliquid account"""
-        state = self.strategies.get(account_id)
-        if not state:
-            return
+    """Strategy manager driving Hyperliquid accounts"""
 
-        # Note: running state and timestamp already set in should_trigger
-        try:
-            # Immediately persist timestamp to database (before AI call)
-            with SessionLocal() as db:
-                strategy = db.query(AccountStrategyConfig).filter_by(account_id=account_id).first()
-                if strategy:
-                    strategy.last_trigger_at = event_time
-                    db.commit()
-                    logger.info(
-                        f"[HyperliquidStrategy] Strategy execution started for account {account_id}, "
-                        f"next trigger in {strategy.trigger_interval}s ({strategy.trigger_interval/60:.1f}min)"
-                    )
-
-            # Check account configuration
-            with SessionLocal() as db:
-                account = db.query(Account).filter(Account.id == account_id).first()
-                if not account or account.auto_trading_enabled != "true":
-                    logger.debug(f"[HyperliquidStrategy] Account {account_id} auto trading disabled, skipping")
-                    return
-
-            # Execute Hyperliquid trading decision (may take 10-30 seconds, but won't block next trigger check)
-            place_ai_driven_hyperliquid_order(account_id=account_id)
-
-        except Exception as e:
-            logger.error(f"[HyperliquidStrategy] Error executing strategy for account {account_id}: {e}")
-        finally:
-            # Always reset running state
-            state.running = False
+    _log_prefix = "[HyperliquidStrategy] "
 
 
 # Global strategy manager instance (Hyperliquid only)
@@ -376,7 +492,7 @@ def _execute_strategy_direct(account_id: int, symbol: str, event_time: datetime,
         # Update last trigger time
         strategy = db.query(AccountStrategyConfig).filter_by(account_id=account_id).first()
         if strategy:
-            strategy.last_trigger_at = event_time
+            strategy.last_trigger_at = _to_naive_utc(event_time)
             db.commit()
 
         # Execute the trade
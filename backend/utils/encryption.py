@@ -6,10 +6,18 @@ Private keys are encrypted before storing in database and decrypted only when ne
 """
 import os
 import logging
+import threading
+from typing import Optional
 from cryptography.fernet import Fernet
 
 logger = logging.getLogger(__name__)
 
+# Fernet instance shared by encrypt/decrypt; built once per process
+_fernet_cache: Optional[Fernet] = None
+_fernet_lock = threading.Lock()
+# Resolved key bytes; avoids re-reading the key file and environment on every call
+_cached_key: Optional[bytes] = None
+
 
 def get_encryption_key() -> bytes:
     """
@@ -21,6 +29,16 @@ def get_encryption_key() -> bytes:
     Raises:
         ValueError: If HYPERLIQUID_ENCRYPTION_KEY not found
     """
+    global _cached_key
+    if _cached_key is not None:
+        return _cached_key
+
+    _cached_key = _resolve_encryption_key()
+    return _cached_key
+
+
+def _resolve_encryption_key() -> bytes:
+    """Read the encryption key from the persistent file or environment"""
     # Try to read from Docker persistent file first
     key_file = '/app/data/.encryption_key'
     if os.path.exists(key_file):
@@ -39,6 +57,32 @@ def get_encryption_key() -> bytes:
     return key.encode()
 
 
+def _get_fernet() -> Fernet:
+    """Return the cached Fernet instance, creating it on first use"""
+    global _fernet_cache
+    fernet = _fernet_cache
+    if fernet is None:
+        with _fernet_lock:
+            fernet = _fernet_cache
+            if fernet is None:
+                fernet = Fernet(get_encryption_key())
+                _fernet_cache = fernet
+    return fernet
+
+
+def invalidate_encryption_cache() -> None:
+    """
+    Drop the cached key and Fernet instance
+
+    Call after rotating HYPERLIQUID_ENCRYPTION_KEY (or between tests) so the
+    next encrypt/decrypt picks up the new key.
+    """
+    global _fernet_cache, _cached_key
+    with _fernet_lock:
+        _cached_key = None
+        _fernet_cache = None
+
+
 def encrypt_private_key(private_key: str) -> str:
     """
     Encrypt private key for database storage
@@ -53,7 +97,7 @@ def encrypt_private_key(private_key: str) -> str:
         ValueError: If encryption fails
     """
     try:
-        f = Fernet(get_encryption_key())
+        f = _get_fernet()
         encrypted = f.encrypt(private_key.encode())
         logger.debug("Private key encrypted successfully")
         return encrypted.decode()
@@ -76,7 +120,7 @@ def decrypt_private_key(encrypted_key: str) -> str:
         ValueError: If decryption fails
     """
     try:
-        f = Fernet(get_encryption_key())
+        f = _get_fernet()
         decrypted = f.decrypt(encrypted_key.encode())
         logger.debug("Private key decrypted successfully")
         return decrypted.decode()
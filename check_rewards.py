@@ -13,8 +13,14 @@ python check_rewards.py 0x012E82f81e506b8f0EF69FF719a6AC65822b5924
 #!/usr/bin/env python3
 import requests
 import sys
+from requests.adapters import HTTPAdapter
 
 INFO_URL = "https://api.hyperliquid.xyz/info"
+REQUEST_TIMEOUT = 10  # seconds
+
+# Reuse one pooled connection so repeated lookups skip the TLS handshake
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
 
 # <<< EDIT THIS TO YOUR MAIN WALLET ADDRESS >>>
 WALLET_ADDRESS = "0x950D50d2e1C009212B1511e1Ec06F572d577AC15"
@@ -25,7 +31,7 @@ def get_referral_state(user_addr: str) -> dict:
         "user": user_addr
     }
 
-    resp = requests.post(INFO_URL, json=payload)
+    resp = _session.post(INFO_URL, json=payload, timeout=REQUEST_TIMEOUT)
     resp.raise_for_status()
     data = resp.json()
 